@@ -5,14 +5,9 @@ import random
 import warnings
 import os
 
-# フォルダが存在しない場合は作成
-os.makedirs('report', exist_ok=True)
-
 warnings.filterwarnings('ignore')
 
 # 初期設定
-np.random.seed(42)
-random.seed(42)
 plt.rcParams['font.family'] = 'Meiryo' # Windows標準
 
 # パラメータ
@@ -32,11 +27,11 @@ class EmployeeGenerator:
         })
 
 # シミュレーション実行ロジック
-def run_simulation():
-    months = range(MONTHS)
+def run_simulation(n_months=MONTHS):
+    months = range(n_months)
     
     # ロジックに基づく推移データ生成
-    hp_ot = [20 + (60 * (m/MONTHS)**0.5) for m in months]
+    hp_ot = [20 + (60 * (m/n_months)**0.5) for m in months]
     urban = [100 * (1 - 0.01 * m) for m in months]
     rural = [100 * (1 - 0.015 * m) for m in months]
     cash = [50 * m + 2 * m**2 for m in months] 
@@ -45,40 +40,51 @@ def run_simulation():
     return months, hp_ot, urban, rural, cash, opp
 
 # 描画と保存
-months, hp_ot, urban, rural, cash, opp = run_simulation()
+def main(output_dir='report', n_months=MONTHS, seed=42):
+    # フォルダが存在しない場合は作成
+    os.makedirs(output_dir, exist_ok=True)
+    np.random.seed(seed)
+    random.seed(seed)
+
+    months, hp_ot, urban, rural, cash, opp = run_simulation(n_months)
+
+    plt.figure(figsize=(18, 5))
 
-plt.figure(figsize=(18, 5))
+    # Graph 1
+    plt.subplot(1, 3, 1)
+    plt.plot(months, hp_ot, color='#c0392b', linewidth=2.5, label='HP Avg Overtime')
+    plt.title('Vicious Cycle: HP Overtime Hours', fontsize=12)
+    plt.ylabel('Overtime (hours/month)')
+    plt.axhline(y=80, color='orange', linestyle='--', label='Karoshi Line (80h)')
+    plt.legend()
+    plt.grid(True)
 
-# Graph 1
-plt.subplot(1, 3, 1)
-plt.plot(months, hp_ot, color='#c0392b', linewidth=2.5, label='HP Avg Overtime')
-plt.title('Vicious Cycle: HP Overtime Hours', fontsize=12)
-plt.ylabel('Overtime (hours/month)')
-plt.axhline(y=80, color='orange', linestyle='--', label='Karoshi Line (80h)')
-plt.legend()
-plt.grid(True)
+    # Graph 2
+    plt.subplot(1, 3, 2)
+    plt.plot(months, urban, label='Urban', marker='o')
+    plt.plot(months, rural, label='Rural', marker='x')
+    plt.title('Retention Rate by Branch', fontsize=12)
+    plt.ylabel('Retention (%)')
+    plt.ylim(50, 105)
+    plt.legend()
+    plt.grid(True)
 
-# Graph 2
-plt.subplot(1, 3, 2)
-plt.plot(months, urban, label='Urban', marker='o')
-plt.plot(months, rural, label='Rural', marker='x')
-plt.title('Retention Rate by Branch', fontsize=12)
-plt.ylabel('Retention (%)')
-plt.ylim(50, 105)
-plt.legend()
-plt.grid(True)
+    # Graph 3
+    plt.subplot(1, 3, 3)
+    cash_np = np.array(cash)
+    opp_np = np.array(opp)
+    plt.fill_between(months, 0, cash_np, color='black', alpha=0.7, label='Direct Cash Out')
+    plt.fill_between(months, cash_np, cash_np + opp_np, color='gray', alpha=0.3, label='Opportunity Loss')
+    plt.title('Cumulative Financial Loss', fontsize=12)
+    plt.ylabel('Loss (Million JPY)')
+    plt.legend()
+    plt.grid(True)
 
-# Graph 3
-plt.subplot(1, 3, 3)
-cash_np = np.array(cash)
-opp_np = np.array(opp)
-plt.fill_between(months, 0, cash_np, color='black', alpha=0.7, label='Direct Cash Out')
-plt.fill_between(months, cash_np, cash_np + opp_np, color='gray', alpha=0.3, label='Opportunity Loss')
-plt.title('Cumulative Financial Loss', fontsize=12)
-plt.ylabel('Loss (Million JPY)')
-plt.legend()
-plt.grid(True)
+    plt.tight_layout()
+    output_path = os.path.join(output_dir, 'simulation_result.png')
+    plt.savefig(output_path)
+    print("✅ simulation_result.png generated.")
+    return [output_path]
 
-plt.tight_layout()
-plt.savefig('report/simulation_result.png') 
-print("✅ simulation_result.png generated.")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+import pandas as pd
+import numpy as np
+import os
+from scipy.special import ndtr, ndtri
+from scipy.stats import truncnorm
+from export_data_for_powerbi import build_export_frame, job_levels
+
+# ■ 合成データのスケーリング (Gaussian Copula)
+# 目的: 実データ無しで Power BI モデルと ROI 集計を 1,000万行規模で負荷試験する
+# - data/hr_sample_data.csv (500行) から各列の周辺分布と、順位ベースの相関構造を推定
+# - 相関付き正規乱数 → 一様化 → 経験分位点関数 で、統計的に同等なデータを任意件数生成
+# - 出力は export_data_for_powerbi.py と同じスキーマで、チャンク単位でベクトル化して書き出す
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SAMPLE_PATH = os.path.join(PROJECT_ROOT, 'data', 'hr_sample_data.csv')
+
+COPULA_COLUMNS = ['Tenure_Years', 'Training_Cost', 'Training_Hours', 'Performance_Score']
+MAX_DISCRETE_LEVELS = 100  # これ以下の種類しかない整数列は離散分布として扱う
+
+# 研修による改善量のノイズ（export_data_for_powerbi.py の N(0.1, 0.2) と同じ）
+IMPROVEMENT_MEAN, IMPROVEMENT_SD = 0.1, 0.2
+
+# JobLevel は勤続年数の順位で割り当てる（構成比は export_data_for_powerbi.py と同じ 40/30/20/10%）
+JOB_LEVEL_CUTOFFS = np.cumsum([0.4, 0.3, 0.2])
+
+
+class GaussianCopulaGenerator:
+    def __init__(self, columns=COPULA_COLUMNS):
+        self.columns = list(columns)
+
+    def fit(self, df):
+        """
+        周辺分布（経験分布）と正規スコアの相関行列を推定する
+        """
+        values = df[self.columns].to_numpy(dtype=float)
+        n = len(values)
+
+        # 周辺分布: ソート済みの値を分位点関数として保持（値の種類が少ない整数列は離散のまま扱う）
+        self.sorted_values = np.sort(values, axis=0)
+        n_unique = (np.diff(self.sorted_values, axis=0) != 0).sum(axis=0) + 1
+        self.is_discrete = np.all(values == np.round(values), axis=0) & (n_unique <= MAX_DISCRETE_LEVELS)
+
+        # 相関構造: 順位 → 正規スコア → 相関行列 (Gaussian copula)
+        ranks = df[self.columns].rank(method='average').to_numpy()
+        normal_scores = ndtri(ranks / (n + 1))
+        self.correlation = np.corrcoef(normal_scores, rowvar=False)
+        self.cholesky = np.linalg.cholesky(self.correlation)
+
+        # 部署は構成比のみを保持
+        self.departments = df['Department'].value_counts(normalize=True).sort_index()
+        return self
+
+    def sample_uniform(self, n_rows, rng):
+        """
+        コピュラから相関付きの一様乱数 (n_rows, 列数) を生成する
+        """
+        z = rng.standard_normal((n_rows, len(self.columns))) @ self.cholesky.T
+        return ndtr(z)
+
+    def _inverse_marginal(self, u, j):
+        sorted_values = self.sorted_values[:, j]
+        n = len(sorted_values)
+        if self.is_discrete[j]:
+            # 離散列: 逆経験分布関数（観測された値のみを返す）
+            return sorted_values[np.minimum((u * n).astype(np.int64), n - 1)]
+        # 連続列: 順序統計量の間を線形補間
+        return np.interp(u, (np.arange(n) + 0.5) / n, sorted_values)
+
+    def sample(self, n_rows, rng, start_id=1001):
+        """
+        export_data_for_powerbi.py と同じスキーマの合成データを n_rows 行生成する
+        """
+        u = self.sample_uniform(n_rows, rng)
+        col = {c: j for j, c in enumerate(self.columns)}
+
+        tenure_u = u[:, col['Tenure_Years']]
+        training_hours = self._inverse_marginal(u[:, col['Training_Hours']], col['Training_Hours']).round(1)
+        cost = self._inverse_marginal(u[:, col['Training_Cost']], col['Training_Cost']).round(0)
+        # サンプルには負のコストの外れ値があるため、ROI が発散しないよう最小の正の観測値で下限を設ける
+        observed_cost = self.sorted_values[:, col['Training_Cost']]
+        cost = np.maximum(cost, observed_cost[observed_cost > 0][0])
+        post_performance = self._inverse_marginal(u[:, col['Performance_Score']], col['Performance_Score'])
+        post_performance = np.clip(post_performance, 1.0, 5.0).round(2)
+
+        dept_data = rng.choice(self.departments.index.to_numpy(), n_rows, p=self.departments.to_numpy())
+        level_data = np.asarray(job_levels)[np.searchsorted(JOB_LEVEL_CUTOFFS, tenure_u)]
+
+        # サンプルの Performance_Score を研修後スコアとみなし、
+        # export_data_for_powerbi.py と同じ改善モデルで研修前スコアを逆算する
+        dept_bias = np.where(dept_data == 'Sales', 0.2, 0)
+        # 研修前スコアが下限 1.0 を割らないよう、改善量のノイズは上限付き正規分布から引く
+        # （単純にクリップすると約 7% の行が 1.0 に張り付く。研修時間に対して研修後スコアが低すぎる
+        #   行は上限付近の値になるため、丸め後に 1.0 となる行が 0.3% 程度残る）
+        noise_upper = post_performance - 1.0 - (training_hours * 0.05) - dept_bias
+        noise = rng.normal(IMPROVEMENT_MEAN, IMPROVEMENT_SD, n_rows)
+        redraw = noise >= noise_upper
+        noise[redraw] = truncnorm.rvs(-np.inf, (noise_upper[redraw] - IMPROVEMENT_MEAN) / IMPROVEMENT_SD,
+                                      loc=IMPROVEMENT_MEAN, scale=IMPROVEMENT_SD, random_state=rng)
+        improvement = (training_hours * 0.05) + noise
+        pre_performance = np.clip(post_performance - improvement - dept_bias, 1.0, 5.0).round(2)
+
+        return build_export_frame(np.arange(start_id, start_id + n_rows), dept_data, level_data,
+                                  training_hours, cost, pre_performance, post_performance)
+
+
+def generate_chunks(generator, n_rows, chunk_size=1_000_000, seed=42):
+    """
+    チャンクごとに独立した乱数列で合成データを生成する（メモリ使用量はチャンクサイズで一定）
+    """
+    n_chunks = -(-n_rows // chunk_size)
+    for i, child in enumerate(np.random.SeedSequence(seed).spawn(n_chunks)):
+        start = i * chunk_size
+        size = min(chunk_size, n_rows - start)
+        yield generator.sample(size, np.random.default_rng(child), start_id=1001 + start)
+
+
+def main(output_dir='data', n_rows=1_000_000, chunk_size=1_000_000, seed=42, sample_path=SAMPLE_PATH):
+    # フォルダ作成
+    os.makedirs(output_dir, exist_ok=True)
+
+    sample = pd.read_csv(sample_path)
+    generator = GaussianCopulaGenerator().fit(sample)
+
+    csv_path = os.path.join(output_dir, f'human_capital_roi_synthetic_{n_rows}.csv')
+    summary_path = os.path.join(output_dir, f'human_capital_roi_synthetic_{n_rows}_summary.csv')
+
+    # ROI集計は書き出しと同時にチャンク単位で積み上げる（Power BI 側の集計結果との突合用）
+    totals = []
+    with open(csv_path, 'w', encoding='utf-8-sig', newline='') as f:
+        for i, chunk in enumerate(generate_chunks(generator, n_rows, chunk_size, seed)):
+            chunk.to_csv(f, header=(i == 0), index=False)
+            totals.append(chunk.groupby('Department')[['TrainingCost', 'ValueCreated']].sum()
+                          .assign(Employees=chunk.groupby('Department').size()))
+            print(f"Chunk {i + 1}: {min((i + 1) * chunk_size, n_rows):,} / {n_rows:,} rows")
+
+    summary = pd.concat(totals).groupby(level=0).sum()
+    summary['ROI_Percent'] = ((summary['ValueCreated'] - summary['TrainingCost'])
+                              / summary['TrainingCost'] * 100).round(1)
+    summary.to_csv(summary_path, encoding='utf-8-sig')
+
+    print(f"Data exported successfully: {csv_path}")
+    print(summary)
+    return [csv_path, summary_path]
+
+
+if __name__ == "__main__":
+    main()
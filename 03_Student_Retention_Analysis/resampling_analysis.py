@@ -0,0 +1,249 @@
+import numpy as np
+import pandas as pd
+import os
+from concurrent.futures import ProcessPoolExecutor
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import roc_auc_score
+from sklearn.model_selection import StratifiedKFold
+
+# ■ リサンプリングによる推定の安定性検証 (Bootstrap / Repeated CV)
+# 目的: value_added_analysis.ipynb (OLS 1回) と dropout_prediction_model.ipynb (分割 1回) の推定値が
+#       どの程度ぶれるのかを、数千回のリサンプルで分布として確認する
+# 対象:
+#   - 「アルバイト時間 → 自習時間 → GPA」の媒介パス
+#     ※ value_added_analysis.ipynb のデータには自習時間を介したパスが無いため、
+#       generate_visuals.py と同じ構造の代替データで検証する（実データは列名を指定して渡せる）
+#   - dropout_prediction_model.ipynb のロジスティック回帰（同じデータ生成・説明変数）の係数とAUC
+
+# 1チャンクあたりのブートストラップ重み行列の上限サイズ (全国規模 n でもメモリを一定に保つ)
+MAX_CHUNK_BYTES = 256 * 1024 ** 2
+
+# 媒介パスの列 (原因, 媒介変数, 結果)
+PATH_COLUMNS = ['Work_Hours', 'Study_Time', 'GPA']
+# dropout_prediction_model.ipynb の説明変数と目的変数
+DROPOUT_FEATURES = ['GPA_1st_Year', 'Attendance_Rate', 'PartTime_Hours', 'Financial_Aid']
+DROPOUT_TARGET = 'Dropout_Flag'
+
+
+# ----------------------------------------------------------
+# 1. データ生成
+# ----------------------------------------------------------
+def generate_student_data(n_students=1000, seed=42):
+    """
+    経済困窮 → アルバイト → 自習時間 → GPA の構造を持つ代替データ (generate_visuals.py と同じ構造)
+    """
+    rng = np.random.default_rng(seed)
+
+    economic_distress = rng.integers(1, 6, n_students)
+    work_hours = np.clip(economic_distress * 5 + rng.normal(0, 5, n_students), 0, 40)
+    study_time = np.clip(40 - work_hours * 0.8 + rng.normal(0, 5, n_students), 0, 50)
+    gpa = np.clip(study_time * 0.08 + rng.normal(1.5, 0.5, n_students), 0.0, 4.0)
+
+    return pd.DataFrame({
+        'Economic_Distress': economic_distress,
+        'Work_Hours': work_hours,
+        'Study_Time': study_time,
+        'GPA': gpa
+    })
+
+
+def generate_dropout_data(n_students=1000, seed=42):
+    """
+    dropout_prediction_model.ipynb と同じデータを生成する（同じシードなら同じ値）
+    """
+    rng = np.random.RandomState(seed)
+
+    df = pd.DataFrame({
+        'Student_ID': range(1, n_students + 1),
+        'GPA_1st_Year': rng.normal(2.5, 0.6, n_students).clip(0, 4.0),
+        'Attendance_Rate': rng.normal(0.85, 0.15, n_students).clip(0, 1.0),
+        'PartTime_Hours': rng.normal(15, 10, n_students).clip(0, 40),
+        'Financial_Aid': rng.choice([0, 1], n_students, p=[0.7, 0.3]),
+    })
+
+    # 退学フラグ: GPAが低く、出席率が悪く、バイト時間が長いほど退学しやすい
+    logits = (
+        -2.0 * df['GPA_1st_Year'] +
+        -3.5 * df['Attendance_Rate'] +
+        0.08 * df['PartTime_Hours'] +
+        -0.5 * df['Financial_Aid'] +
+        1.5
+    )
+    df['Dropout_Flag'] = rng.binomial(1, 1 / (1 + np.exp(-logits)))
+    return df
+
+
+# ----------------------------------------------------------
+# 2. 媒介パスのブートストラップ (Batched OLS)
+# ----------------------------------------------------------
+def _weighted_gram(weights, M):
+    """
+    各リサンプルの重み付きグラム行列 M' W M をまとめて計算する
+    weights: (B, n) 各観測の出現回数, M: (n, k) → (B, k, k)
+    """
+    n, k = M.shape
+    outer = (M[:, :, None] * M[:, None, :]).reshape(n, k * k)
+    return (weights @ outer).reshape(-1, k, k)
+
+
+def bootstrap_path_coefficients(df, path_columns=PATH_COLUMNS, n_resamples=2000, seed=0, chunk_size=None):
+    """
+    「X → M → Y」の媒介パス係数をブートストラップで推定する (既定: Work_Hours → Study_Time → GPA)
+
+    リサンプルを行の複製ではなく出現回数の重みとして表現し、
+    [1, X, M, Y] の重み付きグラム行列から正規方程式をバッチで解く。
+    - 媒介モデル: M ~ 1 + X        (a)
+    - 結果モデル: Y ~ 1 + X + M    (c', b)
+    """
+    x, m, y = path_columns
+    data = df[[x, m, y]].to_numpy(dtype=float)
+    n = len(data)
+    M = np.column_stack([np.ones(n), data])
+
+    if chunk_size is None:
+        # multinomial の int64 配列と float 変換後の配列が同時に存在するため、1行あたり 16 バイトで見積もる
+        chunk_size = max(1, MAX_CHUNK_BYTES // (16 * n))
+    chunk_size = min(chunk_size, n_resamples)
+
+    rng = np.random.default_rng(seed)
+    p = np.full(n, 1.0 / n)
+    results = []
+
+    for start in range(0, n_resamples, chunk_size):
+        size = min(chunk_size, n_resamples - start)
+        weights = rng.multinomial(n, p, size=size).astype(float)
+        G = _weighted_gram(weights, M)
+
+        # 媒介モデル (列: const, X) → 目的変数 M
+        coef_a = np.linalg.solve(G[:, :2, :2], G[:, :2, 2:3])[:, :, 0]
+        # 結果モデル (列: const, X, M) → 目的変数 Y
+        coef_b = np.linalg.solve(G[:, :3, :3], G[:, :3, 3:4])[:, :, 0]
+
+        results.append(pd.DataFrame({
+            f'a_{x}_to_{m}': coef_a[:, 1],
+            f'b_{m}_to_{y}': coef_b[:, 2],
+            f'c_Direct_{x}_to_{y}': coef_b[:, 1],
+        }))
+
+    dist = pd.concat(results, ignore_index=True)
+    dist['Indirect_Effect'] = dist[f'a_{x}_to_{m}'] * dist[f'b_{m}_to_{y}']
+    dist['Total_Effect'] = dist[f'c_Direct_{x}_to_{y}'] + dist['Indirect_Effect']
+    return dist
+
+
+# ----------------------------------------------------------
+# 3. 退学予測モデルのリサンプル (並列プロセス)
+# ----------------------------------------------------------
+def _fit_dropout_resamples(X, y, seeds, scheme, n_splits):
+    """
+    ワーカープロセス側の処理: 割り当てられたシード分のリサンプルを学習・評価する
+    (結果の行と、片方のクラスしか含まずスキップした分割の数を返す)
+    """
+    rows = []
+    n_skipped = 0
+    for seed in seeds:
+        if scheme == 'cv':
+            cv = StratifiedKFold(n_splits=n_splits, shuffle=True, random_state=seed)
+            splits = cv.split(X, y)
+        else:
+            # ブートストラップ: 復元抽出で学習し、Out-of-Bag で評価
+            rng = np.random.default_rng(seed)
+            train_idx = rng.integers(0, len(y), len(y))
+            oob = np.ones(len(y), dtype=bool)
+            oob[train_idx] = False
+            splits = [(train_idx, np.flatnonzero(oob))]
+
+        for fold, (train_idx, test_idx) in enumerate(splits):
+            # 片方のクラスしか含まない分割ではAUCが定義できないためスキップ
+            if len(np.unique(y[train_idx])) < 2 or len(np.unique(y[test_idx])) < 2:
+                n_skipped += 1
+                continue
+            model = LogisticRegression()
+            model.fit(X[train_idx], y[train_idx])
+            auc = roc_auc_score(y[test_idx], model.predict_proba(X[test_idx])[:, 1])
+            rows.append([seed, fold, auc, *model.coef_[0], model.intercept_[0]])
+    return rows, n_skipped
+
+
+def resample_dropout_model(df, features=DROPOUT_FEATURES, target=DROPOUT_TARGET,
+                           n_resamples=1000, scheme='cv', n_splits=5, seed=0, n_jobs=None):
+    """
+    退学予測ロジスティック回帰を n_resamples 回リサンプルし、AUCと係数の分布を返す
+    (既定: dropout_prediction_model.ipynb の説明変数・目的変数)
+
+    scheme='cv'        : 反復 Stratified K-Fold (1リサンプル = n_splits 行)
+    scheme='bootstrap' : 復元抽出 + Out-of-Bag 評価 (1リサンプル = 1 行)
+    リサンプルはワーカー数分のまとまりに分けてプロセス並列で学習する。
+
+    陽性が少ないと片方のクラスしか含まない分割が生じ、AUCが定義できないためスキップする。
+    戻り値は (分布の DataFrame, スキップした分割の数)。
+    """
+    if scheme not in ('cv', 'bootstrap'):
+        raise ValueError(f"scheme must be 'cv' or 'bootstrap', got {scheme!r}")
+
+    X = df[list(features)].to_numpy(dtype=float)
+    y = df[target].to_numpy()
+
+    n_jobs = n_jobs or os.cpu_count() or 1
+    seeds = np.random.default_rng(seed).integers(0, 2 ** 31 - 1, n_resamples)
+    # データの転送回数を抑えるため、タスクはワーカー数程度にまとめる
+    batches = [b.tolist() for b in np.array_split(seeds, min(n_jobs, n_resamples)) if len(b)]
+
+    if n_jobs == 1:
+        results = [_fit_dropout_resamples(X, y, batch, scheme, n_splits) for batch in batches]
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            futures = [executor.submit(_fit_dropout_resamples, X, y, batch, scheme, n_splits)
+                       for batch in batches]
+            results = [future.result() for future in futures]
+
+    rows = [row for batch_rows, _ in results for row in batch_rows]
+    n_skipped = sum(batch_skipped for _, batch_skipped in results)
+    columns = ['Seed', 'Fold', 'AUC'] + [f'Coef_{c}' for c in features] + ['Intercept']
+    return pd.DataFrame(rows, columns=columns), n_skipped
+
+
+# ----------------------------------------------------------
+# 4. 分布の要約 (Percentile Interval)
+# ----------------------------------------------------------
+def summarize_distribution(dist, alpha=0.05):
+    """
+    各列の平均・標準誤差・パーセンタイル信頼区間をまとめる
+    """
+    return pd.DataFrame({
+        'Mean': dist.mean(),
+        'Std_Error': dist.std(ddof=1),
+        f'CI_{alpha / 2:.1%}': dist.quantile(alpha / 2),
+        f'CI_{1 - alpha / 2:.1%}': dist.quantile(1 - alpha / 2),
+    })
+
+
+def main(output_dir='data', n_students=1000, n_bootstrap=5000, n_cv_repeats=200,
+         scheme='cv', n_jobs=None, seed=42):
+    os.makedirs(output_dir, exist_ok=True)
+
+    # 媒介パス: generate_visuals.py と同じ構造の代替データ
+    path_df = generate_student_data(n_students=n_students, seed=seed)
+    path_dist = bootstrap_path_coefficients(path_df, n_resamples=n_bootstrap, seed=seed)
+    print(f"=== 媒介パス係数のブートストラップ分布 (B={n_bootstrap}) ===")
+    print(summarize_distribution(path_dist))
+
+    # 退学予測: dropout_prediction_model.ipynb と同じデータ・モデル
+    dropout_df = generate_dropout_data(n_students=n_students, seed=seed)
+    print(f"\n退学率 (Dummy Data): {dropout_df['Dropout_Flag'].mean():.1%}")
+    auc_dist, n_skipped = resample_dropout_model(dropout_df, n_resamples=n_cv_repeats, scheme=scheme,
+                                                 seed=seed, n_jobs=n_jobs)
+    print(f"\n=== 退学予測モデルのリサンプル ({scheme}, {n_cv_repeats}回) ===")
+    print(f"片方のクラスしか含まずスキップした分割: {n_skipped} / {len(auc_dist) + n_skipped}")
+    print(summarize_distribution(auc_dist.drop(columns=['Seed', 'Fold'])))
+
+    # 分布そのものを保存（後段で信頼区間の描画などに使う）
+    path_csv = os.path.join(output_dir, 'path_coefficients_bootstrap.csv')
+    auc_csv = os.path.join(output_dir, 'dropout_model_resamples.csv')
+    path_dist.to_csv(path_csv, index=False)
+    auc_dist.to_csv(auc_csv, index=False)
+    return [path_csv, auc_csv]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+import numpy as np
+import json
+import os
+
+# ■ Martell-Lane型 昇進シミュレーション (時系列版)
+# 目的: 評価バイアスが階層ごとの男女構成に与える影響を、サイクルごとの統計量として記録する
+# 参考: Martell, Lane & Emrich (1996) "Male-Female Differences: A Computer Simulation"
+#
+# 1サイクルの流れ:
+#   1. 全員の評価スコアを生成（男性に bias_effect を加算）
+#   2. 各階層で turnover_rate の確率で退職 → 空席が発生
+#   3. 上位階層から順に、ひとつ下の階層のスコア上位者を昇進させて空席を埋める
+#   4. 昇進で埋まらなかった空席（主にL1）は男女50:50の新規採用で埋める
+#
+# 記録は構造化NumPy配列に事前確保したバッファへ書き込む。
+# history_size を指定すると直近Kサイクルだけを保持するリングバッファとして動作し、
+# 10,000サイクル級の定常状態シミュレーションでもメモリ使用量が一定になる。
+
+GENDERS = ('Male', 'Female')  # 統計配列の最後の軸 (0: Male, 1: Female)
+QUANTILES = (0.1, 0.5, 0.9)
+
+
+def history_dtype(n_levels, quantiles=QUANTILES):
+    """
+    1サイクル分の記録レコードの型（階層 × 性別の統計量）
+    """
+    return np.dtype([
+        ('cycle', 'i8'),
+        ('headcount', 'i4', (n_levels, 2)),        # サイクル終了時点の在籍者数
+        ('promotions', 'i4', (n_levels, 2)),       # その階層への昇進者数
+        ('exits', 'i4', (n_levels, 2)),            # その階層からの退職者数
+        ('hires', 'i4', (n_levels, 2)),            # 外部からの新規採用者数
+        ('score_mean', 'f8', (n_levels,)),         # 評価スコアの平均
+        ('score_quantiles', 'f8', (n_levels, len(quantiles))),
+    ])
+
+
+class MartellLaneSimulation:
+    def __init__(self, n_levels=8, n_employees=500, turnover_rate=0.15, bias_effect=0.05,
+                 n_cycles=20, history_size=None, quantiles=QUANTILES, seed=42):
+        self.config = {
+            'n_levels': n_levels,
+            'n_employees': n_employees,
+            'turnover_rate': turnover_rate,
+            'bias_effect': bias_effect,
+            'n_cycles': n_cycles,
+            'history_size': history_size,
+            'quantiles': list(quantiles),
+            'seed': seed,
+        }
+        self.n_levels = n_levels
+        # 各階層の定員（整数なら全階層同数、リストなら L1 から順に指定）
+        self.level_sizes = np.broadcast_to(np.asarray(n_employees, dtype=int), (n_levels,)).copy()
+        self.turnover_rate = turnover_rate
+        self.bias_effect = bias_effect
+        self.n_cycles = n_cycles
+        self.quantiles = np.asarray(quantiles, dtype=float)
+        self.rng = np.random.default_rng(seed)
+
+        # 状態は 階層 × ポスト の配列で保持（定員を超えるポストは常に空き扱い）
+        n_slots = self.level_sizes.max()
+        self.slots = np.arange(n_slots) < self.level_sizes[:, None]
+
+        # 初期状態: 全階層で男女比 50:50、全ポスト充足
+        self.female = np.zeros((n_levels, n_slots), dtype=bool)
+        self.female[:, 1::2] = True
+        self.occupied = self.slots.copy()
+        self.cycle = 0
+
+        # 記録用バッファ (リングバッファモードでは直近 history_size サイクルのみ)
+        self.capacity = history_size or n_cycles
+        self.buffer = np.zeros(self.capacity, dtype=history_dtype(n_levels, quantiles))
+
+    # ------------------------------------------------------
+    # シミュレーション本体
+    # ------------------------------------------------------
+    def step(self):
+        """
+        1サイクル進め、統計量をバッファに記録する
+        """
+        female, occupied = self.female, self.occupied
+        male = ~female
+
+        # 1. 評価スコア (男性にバイアスを加算)
+        scores = self.rng.normal(0, 1, female.shape) + self.bias_effect * male
+        masked_scores = np.where(occupied, scores, np.nan)
+
+        # 2. 退職
+        exited = occupied & (self.rng.random(female.shape) < self.turnover_rate)
+        exits = np.stack([(exited & male).sum(axis=1), (exited & female).sum(axis=1)], axis=1)
+        occupied &= ~exited
+
+        # 3. 上位階層から順に、下の階層のスコア上位者で空席を埋める
+        promotions = np.zeros((self.n_levels, 2), dtype=np.int32)
+        for lvl in range(self.n_levels - 1, 0, -1):
+            vacancies = np.flatnonzero(self.slots[lvl] & ~occupied[lvl])
+            candidates = np.flatnonzero(occupied[lvl - 1])
+            n_promoted = min(len(vacancies), len(candidates))
+            if n_promoted == 0:
+                continue
+
+            order = np.argpartition(-scores[lvl - 1, candidates], n_promoted - 1)[:n_promoted]
+            promoted = candidates[order]
+            dest = vacancies[:n_promoted]
+
+            female[lvl, dest] = female[lvl - 1, promoted]
+            occupied[lvl, dest] = True
+            occupied[lvl - 1, promoted] = False
+
+            n_female = int(female[lvl - 1, promoted].sum())
+            promotions[lvl] = (n_promoted - n_female, n_female)
+
+        # 4. 残った空席は新規採用 (男女 50:50)
+        hired = self.slots & ~occupied
+        female[hired] = self.rng.random(int(hired.sum())) < 0.5
+        occupied |= hired
+
+        record = self.buffer[self.cycle % self.capacity]
+        record['cycle'] = self.cycle
+        record['headcount'] = np.stack([(occupied & ~female).sum(axis=1),
+                                        (occupied & female).sum(axis=1)], axis=1)
+        record['promotions'] = promotions
+        record['exits'] = exits
+        record['hires'] = np.stack([(hired & ~female).sum(axis=1), (hired & female).sum(axis=1)], axis=1)
+        record['score_mean'] = np.nanmean(masked_scores, axis=1)
+        record['score_quantiles'] = np.nanquantile(masked_scores, self.quantiles, axis=1).T
+
+        self.cycle += 1
+
+    def run(self, checkpoint_path=None, checkpoint_every=None):
+        """
+        n_cycles に達するまで実行する（途中から再開した場合は続きから）
+
+        checkpoint_path と checkpoint_every を指定すると、一定サイクルごとと終了時に状態を保存する
+        """
+        while self.cycle < self.n_cycles:
+            self.step()
+            if checkpoint_path and checkpoint_every and self.cycle % checkpoint_every == 0:
+                self.save_checkpoint(checkpoint_path)
+        if checkpoint_path:
+            self.save_checkpoint(checkpoint_path)
+        return self
+
+    # ------------------------------------------------------
+    # 記録の取り出し
+    # ------------------------------------------------------
+    def history(self):
+        """
+        記録済みサイクルを古い順に並べた構造化配列を返す
+        """
+        if self.cycle <= self.capacity:
+            return self.buffer[:self.cycle].copy()
+        start = self.cycle % self.capacity
+        return np.concatenate([self.buffer[start:], self.buffer[:start]])
+
+    def female_ratio(self):
+        """
+        サイクル × 階層 の女性比率
+        """
+        headcount = self.history()['headcount']
+        return headcount[..., 1] / headcount.sum(axis=-1)
+
+    # ------------------------------------------------------
+    # チェックポイント (保存・再開)
+    # ------------------------------------------------------
+    def save_checkpoint(self, path):
+        """
+        現在の状態を .npz に保存する（一時ファイル経由で置き換え、書き込み中断でも壊れない）
+        """
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            np.savez(
+                f,
+                config=json.dumps(self.config),
+                rng_state=json.dumps(self.rng.bit_generator.state),
+                cycle=self.cycle,
+                female=self.female,
+                occupied=self.occupied,
+                buffer=self.buffer,
+            )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load_checkpoint(cls, path, n_cycles=None):
+        """
+        保存した状態から再開する（n_cycles を指定すると目標サイクル数を延長できる）
+        """
+        with np.load(path) as data:
+            config = json.loads(str(data['config']))
+            sim = cls(**config)
+            sim.rng.bit_generator.state = json.loads(str(data['rng_state']))
+            sim.cycle = int(data['cycle'])
+            sim.female = data['female'].copy()
+            sim.occupied = data['occupied'].copy()
+            sim.buffer = data['buffer'].copy()
+
+        if n_cycles is not None:
+            if config['history_size'] is None and n_cycles > sim.capacity:
+                # 全履歴モードでは延長分だけバッファを確保し直す
+                buffer = np.zeros(n_cycles, dtype=sim.buffer.dtype)
+                buffer[:sim.capacity] = sim.buffer
+                sim.buffer, sim.capacity = buffer, n_cycles
+            sim.n_cycles = sim.config['n_cycles'] = n_cycles
+        return sim
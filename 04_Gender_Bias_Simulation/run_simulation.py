@@ -1,87 +1,90 @@
 import numpy as np
-import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 import os
-
-# フォルダ作成
-os.makedirs('images', exist_ok=True)
+from martell_lane import MartellLaneSimulation
 
 # 日本語フォント設定（英語で統一）
 plt.rcParams['font.family'] = 'sans-serif'
 
 # --- シミュレーション設定 (Martell-Lane Model inspired) ---
-n_levels = 8          # 組織の階層数 (L1:新人 -> L8:役員)
-n_employees = 500     # 各階層の人数 (ピラミッドではなく簡略化のため同数と仮定)
-promotion_rate = 0.15 # 昇進率
-bias_effect = 0.05    # バイアス効果 (男性の評価スコアに +5% のゲタを履かせる)
-
-# 初期状態: 全階層で男女比 50:50python run_simulation.py
-levels = np.repeat(range(1, n_levels + 1), n_employees)
-gender = np.tile(['Male', 'Female'], int(len(levels)/2))
-df = pd.DataFrame({'Level': levels, 'Gender': gender})
-
-# シミュレーション実行 (20サイクル = 約20年経過)
-history_female_ratio = []
-
-for cycle in range(20):
-    # 1. 評価スコア生成 (正規分布)
-    df['Score'] = np.random.normal(0, 1, len(df))
-    
-    # 2. バイアスの適用 (男性に少しだけ有利な評価)
-    # 男性(Male)のスコアに bias_effect を加算
-    df.loc[df['Gender'] == 'Male', 'Score'] += bias_effect
-    
-    # 3. 昇進プロセス (上位N%が昇進)
-    # 各レベルごとに上位者を抽出して、ひとつ上のレベルへ
-    # (簡易シミュレーションのため、ここでは「レベルごとの女性比率」の変化だけを計算)
-    
-    # 仮想的な昇進: 各レベルの上位15%の男女比を計算し、次のサイクルのそのレベルの男女比とする
-    new_ratios = []
-    for lvl in range(1, n_levels + 1):
-        level_df = df[df['Level'] == lvl]
-        # 上位15%を抽出
-        n_promoted = int(len(level_df) * promotion_rate)
-        top_performers = level_df.nlargest(n_promoted, 'Score')
-        
-        # 女性比率を計算
-        female_ratio = (top_performers['Gender'] == 'Female').mean()
-        new_ratios.append(female_ratio)
-    
-    history_female_ratio.append(new_ratios)
-
-# 結果の集計
-final_ratios = history_female_ratio[-1]
-levels_label = [f'L{i}' for i in range(1, n_levels + 1)]
-
-# --- 可視化 1: 「ガラスの天井」 (Glass Ceiling Effect) ---
-plt.figure(figsize=(10, 6))
-colors = ['#1f77b4' if r < 0.3 else '#2ca02c' for r in final_ratios] # 30%未満は青(警告色代わり)、以上は緑
-
-sns.barplot(x=levels_label, y=final_ratios, palette="Blues_r")
-plt.axhline(0.5, color='red', linestyle='--', label='Target (50%)')
-plt.axhline(0.3, color='orange', linestyle=':', label='Critical Line (30%)')
-
-plt.title(f'The "Glass Ceiling": Female Ratio by Level after 20 Cycles\n(Bias Effect: +{bias_effect*100}%)', fontsize=14)
-plt.ylabel('Female Ratio', fontsize=12)
-plt.xlabel('Organizational Level (L1=Entry -> L8=Executive)', fontsize=12)
-plt.ylim(0, 0.6)
-plt.legend()
-plt.tight_layout()
-plt.savefig('images/glass_ceiling_effect.png', dpi=300)
-print("Saved: images/glass_ceiling_effect.png")
-
-# --- 可視化 2: 時系列変化 (Time Evolution at Top Level) ---
-top_level_history = [cycle[-1] for cycle in history_female_ratio] # L8の推移
-
-plt.figure(figsize=(10, 6))
-plt.plot(range(1, 21), top_level_history, marker='o', color='purple', linewidth=2)
-plt.title('Disappearance of Diversity: Female Ratio in Executives (L8) over Time', fontsize=14)
-plt.xlabel('Simulation Cycles (Years)', fontsize=12)
-plt.ylabel('Female Ratio in Executives', fontsize=12)
-plt.axhline(0.5, color='grey', linestyle='--', alpha=0.5)
-plt.grid(True, linestyle='--', alpha=0.6)
-plt.ylim(0, 0.6)
-plt.tight_layout()
-plt.savefig('images/time_evolution.png', dpi=300)
-print("Saved: images/time_evolution.png")
\ No newline at end of file
+N_LEVELS = 8          # 組織の階層数 (L1:新人 -> L8:役員)
+N_EMPLOYEES = [500, 350, 200, 150, 100, 75, 40, 10]  # 各階層の人数 (Martell-Lane のピラミッド構造)
+TURNOVER_RATE = 0.15  # 各階層の離職率 (空席は下の階層のスコア上位者の昇進で埋まる)
+BIAS_EFFECT = 0.05    # バイアス効果 (男性の評価スコアに +5% のゲタを履かせる)
+N_CYCLES = 20         # シミュレーション期間 (20サイクル = 約20年経過)
+
+
+def main(output_dir='images', n_levels=N_LEVELS, n_employees=N_EMPLOYEES, turnover_rate=TURNOVER_RATE,
+         bias_effect=BIAS_EFFECT, n_cycles=N_CYCLES, history_size=None, seed=42,
+         checkpoint_path=None, checkpoint_every=None):
+    # フォルダ作成
+    os.makedirs(output_dir, exist_ok=True)
+
+    # 初期状態: 全階層で男女比 50:50
+    # チェックポイントがあれば続きから再開する（n_cycles を増やすと期間を延長できる）
+    # 相対パスは output_dir 基準（スイープの各 run が自分のフォルダにチェックポイントを持つ）
+    if checkpoint_path:
+        checkpoint_path = os.path.join(output_dir, checkpoint_path)
+    config = {'n_levels': n_levels, 'n_employees': n_employees, 'turnover_rate': turnover_rate,
+              'bias_effect': bias_effect, 'history_size': history_size, 'seed': seed}
+    if checkpoint_path and os.path.exists(checkpoint_path):
+        sim = MartellLaneSimulation.load_checkpoint(checkpoint_path, n_cycles=n_cycles)
+        saved = {k: sim.config[k] for k in config}
+        if saved != {k: (list(v) if isinstance(v, tuple) else v) for k, v in config.items()}:
+            raise ValueError(f"Checkpoint {checkpoint_path} was saved with different settings: {saved}")
+        print(f"Resumed from checkpoint: {checkpoint_path} (cycle {sim.cycle})")
+    else:
+        sim = MartellLaneSimulation(n_cycles=n_cycles, **config)
+
+    # シミュレーション実行 (階層×性別の在籍数・昇進・退職・スコア分布をサイクルごとに記録)
+    sim.run(checkpoint_path=checkpoint_path, checkpoint_every=checkpoint_every)
+    history = sim.history()
+    history_female_ratio = sim.female_ratio()
+
+    history_path = os.path.join(output_dir, 'simulation_history.npy')
+    np.save(history_path, history)
+
+    # 結果の集計
+    final_ratios = history_female_ratio[-1]
+    levels_label = [f'L{i}' for i in range(1, n_levels + 1)]
+
+    # --- 可視化 1: 「ガラスの天井」 (Glass Ceiling Effect) ---
+    plt.figure(figsize=(10, 6))
+    colors = ['#1f77b4' if r < 0.3 else '#2ca02c' for r in final_ratios] # 30%未満は青(警告色代わり)、以上は緑
+
+    sns.barplot(x=levels_label, y=final_ratios, palette="Blues_r")
+    plt.axhline(0.5, color='red', linestyle='--', label='Target (50%)')
+    plt.axhline(0.3, color='orange', linestyle=':', label='Critical Line (30%)')
+
+    plt.title(f'The "Glass Ceiling": Female Ratio by Level after {n_cycles} Cycles\n(Bias Effect: +{bias_effect*100}%)', fontsize=14)
+    plt.ylabel('Female Ratio', fontsize=12)
+    plt.xlabel(f'Organizational Level (L1=Entry -> L{n_levels}=Executive)', fontsize=12)
+    plt.ylim(0, 0.6)
+    plt.legend()
+    plt.tight_layout()
+    glass_ceiling_path = os.path.join(output_dir, 'glass_ceiling_effect.png')
+    plt.savefig(glass_ceiling_path, dpi=300)
+    print(f"Saved: {glass_ceiling_path}")
+
+    # --- 可視化 2: 時系列変化 (Time Evolution at Top Level) ---
+    top_level_history = history_female_ratio[:, -1] # 最上位階層の推移
+
+    plt.figure(figsize=(10, 6))
+    plt.plot(history['cycle'] + 1, top_level_history, marker='o', color='purple', linewidth=2)
+    plt.title(f'Disappearance of Diversity: Female Ratio in Executives (L{n_levels}) over Time', fontsize=14)
+    plt.xlabel('Simulation Cycles (Years)', fontsize=12)
+    plt.ylabel('Female Ratio in Executives', fontsize=12)
+    plt.axhline(0.5, color='grey', linestyle='--', alpha=0.5)
+    plt.grid(True, linestyle='--', alpha=0.6)
+    plt.ylim(0, 0.6)
+    plt.tight_layout()
+    time_evolution_path = os.path.join(output_dir, 'time_evolution.png')
+    plt.savefig(time_evolution_path, dpi=300)
+    print(f"Saved: {time_evolution_path}")
+
+    return [history_path, glass_ceiling_path, time_evolution_path]
+
+
+if __name__ == "__main__":
+    main()
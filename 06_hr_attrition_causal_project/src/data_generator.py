@@ -3,14 +3,14 @@ import numpy as np
 import random
 import os
 
-# シード値の固定（再現性確保）
-np.random.seed(42)
-random.seed(42)
-
-def generate_hr_data(n_employees=1500, n_months=36):
+def generate_hr_data(n_employees=1500, n_months=36, seed=42):
     """
     設計書に基づき、離職予測・因果推論用の人事データを生成する
     """
+    # シード値の固定（再現性確保）
+    np.random.seed(seed)
+    random.seed(seed)
+
     print(f"Generating data for {n_employees} employees over {n_months} months...")
     
     # ---------------------------------------------------------
@@ -109,19 +109,19 @@ def generate_hr_data(n_employees=1500, n_months=36):
     df = pd.DataFrame(data_list)
     return df
 
-if __name__ == "__main__":
-    # 出力先ディレクトリの確認
-    output_dir = "../data"
-    if not os.path.exists(output_dir):
-        # 実行場所によっては ../data が見つからない場合があるのでカレントを見る
-        if os.path.exists("data"):
-            output_dir = "data"
-        else:
-            os.makedirs(output_dir, exist_ok=True)
+def main(output_dir=None, n_employees=1500, n_months=36, seed=42):
+    # 出力先はプロジェクトルート基準で解決（実行場所に依存しない）
+    if output_dir is None:
+        output_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data")
+    os.makedirs(output_dir, exist_ok=True)
 
     print("データ生成を開始します...")
-    df = generate_hr_data()
+    df = generate_hr_data(n_employees=n_employees, n_months=n_months, seed=seed)
     
     output_path = os.path.join(output_dir, "simulated_hr_data.csv")
     df.to_csv(output_path, index=False)
-    print(f"完了: {len(df)}行のデータを {output_path} に保存しました。")
\ No newline at end of file
+    print(f"完了: {len(df)}行のデータを {output_path} に保存しました。")
+    return [output_path]
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+# src/data_loader.py
+import pandas as pd
+import hashlib
+import json
+import os
+import tempfile
+
+# Featherの読み書きには pyarrow が必要（無い環境ではキャッシュ無しで動作する）
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# ■ データアクセス層 (Data Access Layer)
+# 目的: スクリプト・ノートブック間で同じCSVを毎回パースするコストを無くす
+# - パスはプロジェクトルート基準で解決（実行場所に依存しない）
+# - CSVが無ければ data_generator で同じシードから再生成
+# - CSVの横にFeather形式のキャッシュを置き、CSVの mtime とハッシュが一致する間はそちらを読む
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(PROJECT_ROOT, "data")
+
+# データセット定義: ファイル名・生成パラメータ・列の型（型推論を省略するため明示）
+DATASETS = {
+    "simulated_hr_data": {
+        "filename": "simulated_hr_data.csv",
+        "generator_params": {"n_employees": 1500, "n_months": 36, "seed": 42},
+        "dtypes": {
+            "employee_id": "str",
+            "month": "int64",
+            "age": "int64",
+            "gender": "str",
+            "education": "str",
+            "job_family": "str",
+            "tenure_months": "int64",
+            "base_salary": "float64",
+            "overtime_hours": "float64",
+            "performance_score": "int64",
+            "burnout_index": "float64",
+            "engagement_score": "float64",
+            "training_participation": "int64",
+            "salary_change_flag": "int64",
+            "attrition_flag": "int64",
+        },
+    },
+}
+
+# プロセス内メモ化: {name: (csv の mtime_ns, DataFrame)}
+_MEMORY_CACHE = {}
+
+
+def dataset_path(name):
+    """
+    データセット名からCSVの絶対パスを返す
+    """
+    if name not in DATASETS:
+        raise KeyError(f"Unknown dataset: {name!r} (available: {sorted(DATASETS)})")
+    return os.path.join(DATA_DIR, DATASETS[name]["filename"])
+
+
+def _atomic_write(path, write):
+    """
+    同じフォルダの一意な一時ファイルに write(tmp_path) で書き込み、os.replace で置き換える
+    （複数プロセスが同時に書いても、読み手は書き込み途中のファイルを見ない）
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=os.path.basename(path) + ".", suffix=".tmp")
+    os.close(fd)
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def ensure_dataset(name):
+    """
+    CSVが存在しなければ、生成スクリプトを同じシードで実行して作成する
+    """
+    csv_path = dataset_path(name)
+    if not os.path.exists(csv_path):
+        from data_generator import generate_hr_data
+
+        print(f"'{csv_path}' not found. Regenerating...")
+        df = generate_hr_data(**DATASETS[name]["generator_params"])
+        os.makedirs(os.path.dirname(csv_path), exist_ok=True)
+        _atomic_write(csv_path, lambda tmp_path: df.to_csv(tmp_path, index=False))
+    return csv_path
+
+
+def _file_digest(path, chunk_size=1024 ** 2):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _write_json(path, obj):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(obj, f)
+
+
+def _read_with_cache(csv_path, dtypes):
+    """
+    Featherキャッシュが有効ならそれを読み、無効ならCSVをパースしてキャッシュを作り直す
+    """
+    if not HAS_PYARROW:
+        print("⚠️ pyarrow が見つからないため、キャッシュを使わずにCSVを読み込みます。")
+        return pd.read_csv(csv_path, dtype=dtypes)
+
+    cache_path = os.path.splitext(csv_path)[0] + ".feather"
+    meta_path = cache_path + ".json"
+
+    stat = os.stat(csv_path)
+    meta = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha256": _file_digest(csv_path)}
+
+    if os.path.exists(cache_path) and os.path.exists(meta_path):
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                if json.load(f) == meta:
+                    return pd.read_feather(cache_path)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ キャッシュを読み込めないため、CSVから読み直します: {e}")
+
+    df = pd.read_csv(csv_path, dtype=dtypes)
+
+    # 書き込み途中のキャッシュを読まないよう、プロセスごとの一時ファイル経由で置き換える
+    # （キャッシュを書けなくても、パース済みのデータはそのまま返す）
+    try:
+        _atomic_write(cache_path, df.to_feather)
+        _atomic_write(meta_path, lambda tmp_path: _write_json(tmp_path, meta))
+    except OSError as e:
+        print(f"⚠️ キャッシュを書き込めませんでした: {e}")
+    return df
+
+
+def load_dataset(name, copy=True):
+    """
+    データセットを読み込む（プロセス内でメモ化、ディスク上はFeatherでキャッシュ）
+
+    copy=False にすると共有オブジェクトをそのまま返す（呼び出し側で変更しないこと）
+    """
+    csv_path = ensure_dataset(name)
+    mtime_ns = os.stat(csv_path).st_mtime_ns
+
+    cached = _MEMORY_CACHE.get(name)
+    if cached is None or cached[0] != mtime_ns:
+        df = _read_with_cache(csv_path, DATASETS[name]["dtypes"])
+        _MEMORY_CACHE[name] = (mtime_ns, df)
+    df = _MEMORY_CACHE[name][1]
+    return df.copy() if copy else df
+
+
+def load_hr_data(copy=True):
+    """
+    離職予測・因果推論用の人事パネルデータを読み込む
+    """
+    return load_dataset("simulated_hr_data", copy=copy)
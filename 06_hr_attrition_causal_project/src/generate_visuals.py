@@ -5,6 +5,7 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 import os
 import warnings
+from data_loader import PROJECT_ROOT, load_hr_data
 
 # 設定
 warnings.filterwarnings('ignore')
@@ -12,18 +13,14 @@ plt.style.use('seaborn-v0_8-whitegrid')
 plt.rcParams['font.family'] = 'sans-serif' 
 
 # 保存先ディレクトリの確保
-OUTPUT_DIR = "../images"
+OUTPUT_DIR = os.path.join(PROJECT_ROOT, "images")
 if not os.path.exists(OUTPUT_DIR):
     os.makedirs(OUTPUT_DIR)
 
 print("画像生成プロセスを開始します（レイアウト修正版）...")
 
-# 1. データの読み込み
-try:
-    df = pd.read_csv('../data/simulated_hr_data.csv')
-except FileNotFoundError:
-    print("Error: '../data/simulated_hr_data.csv' not found.")
-    exit()
+# 1. データの読み込み（CSVが無い場合は data_generator で再生成される）
+df = load_hr_data()
 
 # ---------------------------------------------------------
 # Graph 1: 離職率の推移 (Attrition Curve)
@@ -0,0 +1,261 @@
+# simulation_runner.py
+import argparse
+import importlib.util
+import itertools
+import json
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+
+# 画面の無いクラスタノードでも描画できるよう、matplotlib の読み込み前にバックエンドを固定
+os.environ.setdefault('MPLBACKEND', 'Agg')
+
+try:
+    import tomllib
+except ImportError:  # Python 3.10 以前
+    tomllib = None
+
+# ■ シミュレーション一括実行ランナー (Simulation Runner)
+# 目的: 各プロジェクトのシミュレーションを、設定ファイル (TOML / YAML) から同じ手順で実行する
+# - 出力先は設定ファイルの output_root（絶対パスに解決）配下の run ごとのフォルダ
+# - 複数の設定・パラメータスイープをワーカープールで並列実行
+# - run ごとに manifest.json（パラメータ・所要時間・出力ファイル）、全体で batch_manifest を保存
+#
+# 使い方:
+#   python simulation_runner.py configs/gender_bias_sweep.toml -j 8
+#   python simulation_runner.py configs/ --output-root /scratch/portfolio_runs
+#   python simulation_runner.py --list
+
+REPO_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# プロジェクト名 → main(output_dir=..., **params) を持つスクリプト
+PROJECTS = {
+    'org_resilience': '01_Strategic_Org_Resilience/python/simulation_model.py',
+    'human_capital_roi': '02_Human_Capital_ROI/src/export_data_for_powerbi.py',
+    'hr_roi_synthetic': '02_Human_Capital_ROI/src/synthetic_scaling.py',
+    'student_retention': '03_Student_Retention_Analysis/generate_visuals.py',
+    'student_resampling': '03_Student_Retention_Analysis/resampling_analysis.py',
+    'gender_bias': '04_Gender_Bias_Simulation/run_simulation.py',
+    'macro_environment': '05_Macro_Environment_Analysis/generate_macro_visuals.py',
+    'hr_attrition': '06_hr_attrition_causal_project/src/data_generator.py',
+}
+
+# ワーカープロセス内で読み込み済みのモジュール
+_MODULES = {}
+
+
+# ----------------------------------------------------------
+# 1. 設定ファイルの読み込みと run の展開
+# ----------------------------------------------------------
+def load_project(project):
+    """
+    プロジェクトのスクリプトをモジュールとして読み込む（同じフォルダのモジュールも import 可能にする）
+    """
+    if project not in PROJECTS:
+        raise KeyError(f"Unknown project: {project!r} (available: {sorted(PROJECTS)})")
+    if project not in _MODULES:
+        script_path = os.path.join(REPO_ROOT, PROJECTS[project])
+        script_dir = os.path.dirname(script_path)
+        if script_dir not in sys.path:
+            sys.path.insert(0, script_dir)
+        spec = importlib.util.spec_from_file_location(f"_simulation_{project}", script_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _MODULES[project] = module
+    return _MODULES[project]
+
+
+def load_config(path):
+    """
+    TOML / YAML の設定ファイルを辞書として読み込む
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.toml':
+        if tomllib is None:
+            raise ImportError("TOML の読み込みには Python 3.11 以上が必要です。")
+        with open(path, 'rb') as f:
+            return tomllib.load(f)
+    if ext in ('.yaml', '.yml'):
+        try:
+            import yaml
+        except ImportError:
+            raise ImportError("YAML の読み込みには PyYAML が必要です (pip install pyyaml)。")
+        with open(path, encoding='utf-8') as f:
+            return yaml.safe_load(f) or {}
+    raise ValueError(f"Unsupported config format: {path} (use .toml / .yaml)")
+
+
+def expand_runs(config, config_path, output_root=None):
+    """
+    設定を run のリストに展開する
+
+    設定のトップレベルは1つの run、または [[runs]] の配列（トップレベルの値は共通の既定値）。
+    [sweep] に「パラメータ名 = 値のリスト」を書くと、その直積の数だけ run を生成する。
+    """
+    config_dir = os.path.dirname(os.path.abspath(config_path))
+    config_name = os.path.splitext(os.path.basename(config_path))[0]
+    defaults = {k: v for k, v in config.items() if k != 'runs'}
+    entries = config.get('runs', [{}])
+
+    runs = []
+    for entry in entries:
+        spec = {**defaults, **entry}
+        params = {**defaults.get('params', {}), **entry.get('params', {})}
+        sweep = {**defaults.get('sweep', {}), **entry.get('sweep', {})}
+
+        if 'project' not in spec:
+            raise ValueError(f"{config_path}: 'project' is required")
+        # 設定ファイル内の相対パスは設定ファイルの場所を基準に絶対パスへ解決する
+        # （output_root 引数はそのまま使うので、呼び出し側で絶対パスにしておく）
+        root = output_root or spec.get('output_root')
+        if not root:
+            raise ValueError(f"{config_path}: 'output_root' is required (or pass --output-root)")
+        if not output_root:
+            root = os.path.abspath(os.path.join(config_dir, os.path.expanduser(root)))
+
+        name = spec.get('name', f"{config_name}_{spec['project']}")
+        keys = list(sweep)
+        combos = list(itertools.product(*(sweep[k] for k in keys)))
+        for i, values in enumerate(combos):
+            run_name = name if len(combos) == 1 else f"{name}_{i:04d}"
+            runs.append({
+                'project': spec['project'],
+                'name': run_name,
+                'config': os.path.abspath(config_path),
+                'params': {**params, **dict(zip(keys, values))},
+                'output_root': root,
+                'output_dir': os.path.join(root, run_name),
+            })
+    return runs
+
+
+def collect_config_paths(paths):
+    """
+    引数のファイル・フォルダから設定ファイルを列挙する
+    """
+    config_paths = []
+    for path in paths:
+        if os.path.isdir(path):
+            config_paths.extend(sorted(
+                os.path.join(path, f) for f in os.listdir(path)
+                if os.path.splitext(f)[1].lower() in ('.toml', '.yaml', '.yml')
+            ))
+        else:
+            config_paths.append(path)
+    return config_paths
+
+
+# ----------------------------------------------------------
+# 2. run の実行（ワーカープロセス側）
+# ----------------------------------------------------------
+def execute_run(run):
+    """
+    1つの run を実行し、所要時間・出力ファイルを manifest.json に記録する
+    """
+    os.makedirs(run['output_dir'], exist_ok=True)
+    manifest = {**run, 'started_at': datetime.now().isoformat(timespec='seconds'), 'pid': os.getpid()}
+
+    start = time.perf_counter()
+    try:
+        module = load_project(run['project'])
+        outputs = module.main(output_dir=run['output_dir'], **run['params'])
+        manifest['status'] = 'success'
+        manifest['outputs'] = [os.path.abspath(p) for p in (outputs or [])]
+    except Exception:
+        manifest['status'] = 'failed'
+        manifest['error'] = traceback.format_exc()
+    finally:
+        # 同じワーカーで次の run を実行するため、開いた図はすべて閉じる
+        if 'matplotlib.pyplot' in sys.modules:
+            sys.modules['matplotlib.pyplot'].close('all')
+    manifest['elapsed_sec'] = round(time.perf_counter() - start, 3)
+
+    with open(os.path.join(run['output_dir'], 'manifest.json'), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    return manifest
+
+
+def run_batch(runs, n_workers=1):
+    """
+    run のリストを実行する（n_workers > 1 ならプロセスプールで並列実行）
+    """
+    results = []
+    if n_workers == 1:
+        for run in runs:
+            results.append(execute_run(run))
+            print(f"[{results[-1]['status']}] {run['name']} ({results[-1]['elapsed_sec']:.1f}s)")
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            futures = {executor.submit(execute_run, run): run for run in runs}
+            for future in as_completed(futures):
+                try:
+                    results.append(future.result())
+                except Exception:
+                    # ワーカー自体が落ちた場合 (OOM kill など) も失敗として記録し、バッチは最後まで続ける
+                    results.append({**futures[future], 'status': 'failed',
+                                    'error': traceback.format_exc(), 'elapsed_sec': None})
+                print(f"[{results[-1]['status']}] {results[-1]['name']} ({results[-1]['elapsed_sec'] or 0:.1f}s)")
+    # 実行完了順ではなく、設定に書かれた順に並べ直す
+    order = {run['output_dir']: i for i, run in enumerate(runs)}
+    return sorted(results, key=lambda r: order[r['output_dir']])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run portfolio simulations from TOML / YAML config files.")
+    parser.add_argument('configs', nargs='*', help="config files or directories containing them")
+    parser.add_argument('-j', '--jobs', type=int, default=1, help="number of worker processes (0 = all CPUs)")
+    parser.add_argument('--output-root', help="override output_root of every config")
+    parser.add_argument('--manifest', help="path of the batch manifest (default: <output_root>/batch_manifest_<timestamp>.json)")
+    parser.add_argument('--list', action='store_true', help="list available projects and exit")
+    args = parser.parse_args(argv)
+
+    if args.list or not args.configs:
+        for project, script in PROJECTS.items():
+            print(f"{project:<20} {script}")
+        return 0
+
+    # --output-root は設定ファイルではなく実行時のカレントディレクトリ基準
+    output_root = os.path.abspath(os.path.expanduser(args.output_root)) if args.output_root else None
+    runs = []
+    for config_path in collect_config_paths(args.configs):
+        runs.extend(expand_runs(load_config(config_path), config_path, output_root))
+    for run in runs:
+        if run['project'] not in PROJECTS:
+            parser.error(f"unknown project {run['project']!r} in {run['config']}")
+    if len({run['output_dir'] for run in runs}) != len(runs):
+        parser.error("duplicate run output directories; give each run a unique 'name'")
+
+    n_workers = args.jobs or os.cpu_count() or 1
+    print(f"Running {len(runs)} run(s) with {n_workers} worker(s)...")
+
+    started_at = datetime.now()
+    start = time.perf_counter()
+    results = run_batch(runs, n_workers=n_workers)
+    elapsed = time.perf_counter() - start
+
+    n_failed = sum(r['status'] != 'success' for r in results)
+    manifest_path = args.manifest or os.path.join(
+        os.path.commonpath([run['output_root'] for run in runs]),
+        f"batch_manifest_{started_at:%Y%m%d_%H%M%S}.json",
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(manifest_path)), exist_ok=True)
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'started_at': started_at.isoformat(timespec='seconds'),
+            'elapsed_sec': round(elapsed, 3),
+            'n_workers': n_workers,
+            'n_runs': len(results),
+            'n_failed': n_failed,
+            'runs': results,
+        }, f, ensure_ascii=False, indent=2)
+
+    print(f"完了: {len(results) - n_failed}/{len(results)} run(s) succeeded in {elapsed:.1f}s")
+    print(f"Manifest: {manifest_path}")
+    return 1 if n_failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())